@@ -1,5 +1,9 @@
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from crud.async_crud import BaseAsyncCRUD
 from models import JobComment
@@ -28,6 +32,133 @@ class CRUDJobComment(
         )
         result = await db.execute(statement)
         return result.scalars().all()
-        
+
+    async def get_nesting_depth(self, db: AsyncSession, *, id: int) -> int:
+        parents_cte = (
+            select(self.model.id, self.model.parent_id)
+            .where(self.model.id == id, self.model.is_deleted.is_(False))
+            .cte("parents_cte", recursive=True)
+        )
+        parents_cte = parents_cte.union_all(
+            select(self.model.id, self.model.parent_id).join(
+                parents_cte, parents_cte.c.parent_id == self.model.id
+            )
+        )
+        statement = select(func.count()).select_from(parents_cte)
+        result = await db.execute(statement)
+        return result.scalar_one()
+
+    async def get_root_ids(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: int,
+        cursor: Optional[int] = None,
+        limit: int,
+    ) -> List[int]:
+        statement = select(self.model.id).where(
+            self.model.job_id == job_id, self.model.parent_id.is_(None)
+        )
+        if cursor is not None:
+            statement = statement.where(self.model.id > cursor)
+        result = await db.execute(
+            statement.order_by(self.model.id).limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_threads(
+        self, db: AsyncSession, *, root_ids: List[int]
+    ) -> List[JobComment]:
+        thread_cte = (
+            select(self.model.id)
+            .where(self.model.id.in_(root_ids))
+            .cte("thread_cte", recursive=True)
+        )
+        thread_cte = thread_cte.union_all(
+            select(self.model.id).join(
+                thread_cte, self.model.parent_id == thread_cte.c.id
+            )
+        )
+        statement = (
+            select(self.model)
+            .where(self.model.id.in_(select(thread_cte.c.id)))
+            .order_by(self.model.id)
+        )
+        result = await db.execute(statement)
+        return result.scalars().all()
+
+    async def remove_deleted_leaves(
+        self, db: AsyncSession, *, retention: timedelta, limit: int
+    ) -> int:
+        deleted_before = datetime.now(timezone.utc) - retention
+        if not self.model.updated_at.type.timezone:
+            deleted_before = deleted_before.replace(tzinfo=None)
+        children = aliased(self.model)
+        result = await db.execute(
+            select(self.model.id)
+            .where(
+                self.model.is_deleted.is_(True),
+                self.model.updated_at < deleted_before,
+                ~exists().where(children.parent_id == self.model.id),
+            )
+            .limit(limit)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            return 0
+        likes = self.model.users_likes.property.secondary
+        likes_comment_id = next(
+            column
+            for column in likes.c
+            if column.references(self.model.__table__.c.id)
+        )
+        await db.execute(delete(likes).where(likes_comment_id.in_(ids)))
+        await db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return len(ids)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        job_id: Optional[int] = None,
+        author_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[JobComment]:
+        filters = [self.model.is_deleted.is_(False)]
+        if job_id is not None:
+            filters.append(self.model.job_id == job_id)
+        if author_id is not None:
+            filters.append(self.model.author_id == author_id)
+        if db.get_bind().dialect.name == "postgresql":
+            document = func.to_tsvector("russian", self.model.text)
+            ts_query = func.websearch_to_tsquery("russian", query)
+            filters.append(document.bool_op("@@")(ts_query))
+            order_by = [
+                func.ts_rank(document, ts_query).desc(),
+                self.model.id.desc(),
+            ]
+        else:
+            # Без ранжирования: поиск подстроки с учетом регистра,
+            # новые комментарии первыми. instr(), а не LIKE: LIKE в SQLite
+            # не учитывает регистр только для латиницы.
+            filters.append(func.instr(self.model.text, query) > 0)
+            order_by = [self.model.id.desc()]
+        statement = (
+            select(self.model)
+            .where(*filters)
+            .order_by(*order_by)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(statement)
+        return result.scalars().all()
+
     ...
     
\ No newline at end of file
@@ -1,3 +1,6 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -41,11 +44,12 @@ class JobCommentService:
                     status_code=404,
                     detail=f"Comment {parent_uid} not found",
                 )
-        if data.get("first_parent_uid"):
-            if not await crud_comments.get_by_uid(db, uid=parent_uid):
+        first_parent_uid = data.get("first_parent_uid")
+        if first_parent_uid and first_parent_uid != parent_uid:
+            if not await crud_comments.get_by_uid(db, uid=first_parent_uid):
                 raise HTTPException(
                     status_code=404,
-                    detail=f"Comment {parent_uid} not found",
+                    detail=f"Comment {first_parent_uid} not found",
                 )
         return await crud_comments.create(
             db=db,
@@ -62,7 +66,94 @@ class JobCommentService:
         comment: JobComment,
     ) -> int:
         return (
-            len(await crud_comments.get_parents(db, id=comment.parent_id)) + 1
+            await crud_comments.get_nesting_depth(db, id=comment.parent_id)
+            + 1
+        )
+
+    @staticmethod
+    async def get_comment_thread(
+        db: AsyncSession,
+        job: Job,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        children_limit: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Дерево комментариев задачи.
+        Корневые комментарии страницы выбираются в БД по курсору, затем
+        одним запросом загружаются их ветки целиком: children_limit
+        ограничивает только ответ, а не загрузку. Удаленный комментарий
+        попадает в дерево заглушкой без текста и автора
+        ({"comment": None, "is_deleted": True}), только если у него есть
+        не удаленные ответы, поэтому на странице может быть меньше limit
+        корневых комментариев.
+        - cursor (int | None):
+            id последнего корневого комментария предыдущей страницы.
+        - limit (int):
+            Количество корневых комментариев на странице, не меньше 1.
+        - children_limit (int):
+            Максимальное количество ответов на каждом уровне, не меньше 0.
+        """
+        if limit < 1 or children_limit < 0:
+            raise HTTPException(
+                status_code=400,
+                detail="limit must be >= 1 and children_limit must be >= 0",
+            )
+        root_ids = await crud_comments.get_root_ids(
+            db, job_id=job.id, cursor=cursor, limit=limit + 1
         )
+        next_cursor = root_ids[limit - 1] if len(root_ids) > limit else None
+        root_ids = root_ids[:limit]
+        if not root_ids:
+            return {"items": [], "next_cursor": None}
+        comments = await crud_comments.get_threads(db, root_ids=root_ids)
+
+        children_ids: Dict[int, List[int]] = {}
+        for comment in comments:
+            if comment.parent_id is not None:
+                children_ids.setdefault(comment.parent_id, []).append(
+                    comment.id
+                )
+        # Ответы создаются после родителя, поэтому в обратном порядке id
+        # все ответы комментария обработаны раньше него самого.
+        nodes: Dict[int, Dict[str, Any]] = {}
+        for comment in reversed(comments):
+            children = [
+                nodes[child_id]
+                for child_id in children_ids.get(comment.id, [])
+                if child_id in nodes
+            ]
+            if comment.is_deleted and not children:
+                continue
+            nodes[comment.id] = {
+                "comment": None if comment.is_deleted else comment,
+                "is_deleted": comment.is_deleted,
+                "children": children[:children_limit],
+                "children_count": len(children),
+            }
+        roots = [nodes[root_id] for root_id in root_ids if root_id in nodes]
+        return {"items": roots, "next_cursor": next_cursor}
+
+    @staticmethod
+    async def purge_deleted_comments(
+        db: AsyncSession,
+        retention: timedelta = timedelta(days=30),
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Окончательное удаление помеченных удаленными комментариев без
+        ответов, если с момента удаления прошло больше retention.
+        Удаление идет пачками по batch_size в отдельных транзакциях до
+        тех пор, пока есть что удалять: комментарий, все ответы которого
+        удалены в предыдущих пачках, попадает в следующую.
+        """
+        total = 0
+        while True:
+            removed = await crud_comments.remove_deleted_leaves(
+                db, retention=retention, limit=batch_size
+            )
+            total += removed
+            if not removed:
+                return total
     
     ...
@@ -0,0 +1,15 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from tests.utils.query_counter import QueryCounter
+
+
+@pytest.fixture
+def query_counter() -> Generator[QueryCounter, None, None]:
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(Engine, "before_cursor_execute", counter)
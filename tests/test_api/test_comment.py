@@ -5,10 +5,12 @@ from httpx import AsyncClient
 from pytest_mock import MockerFixture
 
 from constants.comment import COMMENTS_NESTING_MAX_DEPTH
+from crud.comments import comments as crud_comments
 from models.comment import JobComment
 from models.job import Job
 from models.user import User
 from schemas.comment import JobCommentCreate, JobCommentUpdate
+from tests.utils.query_counter import QueryCounter
 
 ROOT_ENDPOINT = "/check-point/api/v1/comment/"
 
@@ -161,6 +163,136 @@ class TestJobCommentApi:
                 response_data = response.json()
                 parent_uid = response_data["uid"]
 
+    async def test_create_nested_comments_query_count(
+        self,
+        http_client: AsyncClient,
+        job: Job,
+        auth_headers: dict,
+        user: User,
+        mocker: MockerFixture,
+        query_counter: QueryCounter,
+    ):
+        """
+        Количество запросов при создании ответа не зависит от глубины
+        вложенности комментария.
+        """
+        mocker.patch(
+            "notifications.ws_manager.WebSocketManager.send_to_user",
+            return_value=None,
+        )
+        parent_uid = None
+        first_reply_statements = []
+        for i in range(COMMENTS_NESTING_MAX_DEPTH):
+            comment = JobCommentCreate(
+                text=f"Create comment {i + 1}",
+                parent_uid=parent_uid,
+                job_uid=job.uid,
+                author_uid=user.uid,
+            )
+            query_counter.reset()
+            response = await http_client.post(
+                ROOT_ENDPOINT,
+                headers=auth_headers,
+                json=comment.model_dump(mode="json"),
+            )
+            assert response.status_code == 201
+            if i == 1:
+                first_reply_statements = list(query_counter.statements)
+            elif i > 1:
+                query_counter.assert_not_more_than(first_reply_statements)
+            parent_uid = response.json()["uid"]
+
+    async def test_create_with_first_parent(
+        self,
+        http_client: AsyncClient,
+        job: Job,
+        auth_headers: dict,
+        user: User,
+        job_comment: JobComment,
+        mocker: MockerFixture,
+    ):
+        mocker.patch(
+            "notifications.ws_manager.WebSocketManager.send_to_user",
+            return_value=None,
+        )
+        reply = JobCommentCreate(
+            text="Create reply",
+            parent_uid=job_comment.uid,
+            job_uid=job.uid,
+            author_uid=user.uid,
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=auth_headers,
+            json=reply.model_dump(mode="json"),
+        )
+        assert response.status_code == 201
+
+        nested_reply = JobCommentCreate(
+            text="Create nested reply",
+            parent_uid=response.json()["uid"],
+            first_parent_uid=job_comment.uid,
+            job_uid=job.uid,
+            author_uid=user.uid,
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=auth_headers,
+            json=nested_reply.model_dump(mode="json"),
+        )
+        assert response.status_code == 201
+
+    async def test_create_with_first_parent_equal_to_parent(
+        self,
+        http_client: AsyncClient,
+        job: Job,
+        auth_headers: dict,
+        user: User,
+        job_comment: JobComment,
+        mocker: MockerFixture,
+    ):
+        mocker.patch(
+            "notifications.ws_manager.WebSocketManager.send_to_user",
+            return_value=None,
+        )
+        spy_get_by_uid = mocker.spy(crud_comments, "get_by_uid")
+        reply = JobCommentCreate(
+            text="Create reply",
+            parent_uid=job_comment.uid,
+            first_parent_uid=job_comment.uid,
+            job_uid=job.uid,
+            author_uid=user.uid,
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=auth_headers,
+            json=reply.model_dump(mode="json"),
+        )
+        assert response.status_code == 201
+        assert spy_get_by_uid.call_count == 1
+
+    async def test_create_with_invalid_first_parent(
+        self,
+        http_client: AsyncClient,
+        job: Job,
+        auth_headers: dict,
+        user: User,
+        job_comment: JobComment,
+    ):
+        comment = JobCommentCreate(
+            text="Create comment",
+            parent_uid=job_comment.uid,
+            first_parent_uid=uuid.uuid4(),
+            job_uid=job.uid,
+            author_uid=user.uid,
+        )
+        response = await http_client.post(
+            ROOT_ENDPOINT,
+            headers=auth_headers,
+            json=comment.model_dump(mode="json"),
+        )
+        assert response.status_code == 404
+
     async def test_update_by_not_author(
         self,
         http_client: AsyncClient,
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import os
+import subprocess
+import time
+from typing import Dict, List
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.comment import COMMENTS_NESTING_MAX_DEPTH
+from models.account import Account
+from models.folder import Folder
+from models.job import Job
+from models.user import User
+from schemas.comment import JobCommentCreate
+from schemas.password import ResetEmailPassword
+from tests.utils.comments import create_comment
+
+ROOT_ENDPOINT = "/check-point/api/v1/"
+BENCHMARK_OUTPUT = os.getenv("BENCHMARK_OUTPUT", "benchmark_results.json")
+BENCHMARK_CONCURRENCY = int(os.getenv("BENCHMARK_CONCURRENCY", "10"))
+BENCHMARK_REQUESTS = int(os.getenv("BENCHMARK_REQUESTS", "200"))
+BENCHMARK_FOLDERS = int(os.getenv("BENCHMARK_FOLDERS", "10000"))
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BENCHMARK"),
+    reason="Нагрузочные тесты запускаются только при BENCHMARK=1",
+)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = round(percent / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+def save_result(name: str, latencies: List[float], total_time: float) -> None:
+    """
+    Запись результатов замера в BENCHMARK_OUTPUT (JSON).
+    Результаты сохраняются по коммиту, чтобы сравнивать их между версиями.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    try:
+        with open(BENCHMARK_OUTPUT) as file:
+            results = json.load(file)
+    except (OSError, ValueError):
+        results = {}
+    results.setdefault(commit or "unknown", {})[name] = {
+        "requests": len(latencies),
+        "concurrency": BENCHMARK_CONCURRENCY,
+        "rps": round(len(latencies) / total_time, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+    with open(BENCHMARK_OUTPUT, "w") as file:
+        json.dump(results, file, indent=2, ensure_ascii=False)
+
+
+async def run_load(
+    http_client: AsyncClient,
+    name: str,
+    method: str,
+    endpoint: str,
+    expected_status: int = 200,
+    **kwargs,
+) -> None:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+
+    async def send() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await http_client.request(method, endpoint, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == expected_status
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(BENCHMARK_REQUESTS)))
+    save_result(name, latencies, time.perf_counter() - start)
+
+
+class TestBenchmarkApi:
+    async def test_comment_list(
+        self,
+        http_client: AsyncClient,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+        auth_headers: Dict,
+    ) -> None:
+        parent = None
+        for _ in range(COMMENTS_NESTING_MAX_DEPTH):
+            parent = await create_comment(async_session, job, user, parent)
+        await run_load(
+            http_client,
+            "comment_list",
+            "GET",
+            f"{ROOT_ENDPOINT}comment/job/{job.uid}/",
+            headers=auth_headers,
+        )
+
+    async def test_comment_create_deepest_reply(
+        self,
+        http_client: AsyncClient,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+        auth_headers: Dict,
+        mocker: MockerFixture,
+    ) -> None:
+        mocker.patch(
+            "notifications.ws_manager.WebSocketManager.send_to_user",
+            return_value=None,
+        )
+        parent = None
+        for _ in range(COMMENTS_NESTING_MAX_DEPTH - 1):
+            parent = await create_comment(async_session, job, user, parent)
+        data = JobCommentCreate(
+            text="Benchmark reply",
+            parent_uid=parent.uid,
+            job_uid=job.uid,
+            author_uid=user.uid,
+        )
+        await run_load(
+            http_client,
+            "comment_create_deepest_reply",
+            "POST",
+            f"{ROOT_ENDPOINT}comment/",
+            expected_status=201,
+            headers=auth_headers,
+            json=data.model_dump(mode="json"),
+        )
+
+    async def test_folder_tree(
+        self,
+        http_client: AsyncClient,
+        async_session: AsyncSession,
+        account: Account,
+        auth_headers: Dict,
+    ) -> None:
+        """
+        Папки создаются пакетными INSERT по уровням с одним commit:
+        около sqrt(BENCHMARK_FOLDERS) папок под корнем, остальные
+        вложены в них.
+        """
+        root_id = await async_session.scalar(
+            insert(Folder)
+            .values(name="root", order=0, account_id=account.id, is_root=True)
+            .returning(Folder.id)
+        )
+        branches_count = max(1, int(BENCHMARK_FOLDERS**0.5))
+        result = await async_session.scalars(
+            insert(Folder).returning(Folder.id),
+            [
+                {
+                    "name": f"Benchmark folder {i + 1}",
+                    "order": i,
+                    "account_id": account.id,
+                    "parent_id": root_id,
+                }
+                for i in range(branches_count)
+            ],
+        )
+        branch_ids = result.all()
+        leaves_count = BENCHMARK_FOLDERS - branches_count
+        if leaves_count > 0:
+            await async_session.execute(
+                insert(Folder),
+                [
+                    {
+                        "name": f"Benchmark subfolder {i + 1}",
+                        "order": i // branches_count,
+                        "account_id": account.id,
+                        "parent_id": branch_ids[i % branches_count],
+                    }
+                    for i in range(leaves_count)
+                ],
+            )
+        await async_session.commit()
+        await run_load(
+            http_client,
+            "folder_tree",
+            "GET",
+            f"{ROOT_ENDPOINT}folders/{account.uid}/",
+            headers=auth_headers,
+        )
+
+    async def test_password_check(
+        self,
+        http_client: AsyncClient,
+        user: User,
+    ) -> None:
+        data = ResetEmailPassword(email=user.email)
+        await run_load(
+            http_client,
+            "password_check",
+            "POST",
+            f"{ROOT_ENDPOINT}password/check/",
+            json=data.model_dump(),
+        )
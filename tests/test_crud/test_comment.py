@@ -0,0 +1,94 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.comments import comments as crud_comments
+from models.job import Job
+from models.user import User
+from tests.utils.comments import create_comment
+
+
+class TestJobCommentCRUD:
+    async def test_search_by_job_and_author(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+        another_user: User,
+    ):
+        user_comment = await create_comment(
+            async_session, job, user, text="Привет, проверка поиска"
+        )
+        another_user_comment = await create_comment(
+            async_session, job, another_user, text="Привет от другого автора"
+        )
+        await create_comment(async_session, job, user, text="Другой текст")
+
+        found = await crud_comments.search(
+            async_session, query="Привет", job_id=job.id
+        )
+        assert {comment.id for comment in found} == {
+            user_comment.id,
+            another_user_comment.id,
+        }
+
+        found = await crud_comments.search(
+            async_session, query="Привет", job_id=job.id, author_id=user.id
+        )
+        assert [comment.id for comment in found] == [user_comment.id]
+
+        found = await crud_comments.search(
+            async_session, query="Привет", job_id=-1
+        )
+        assert found == []
+
+    async def test_search_without_matches(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+    ):
+        await create_comment(async_session, job, user, text="Привет, проверка")
+        found = await crud_comments.search(
+            async_session, query="Пока", job_id=job.id
+        )
+        assert found == []
+
+    async def test_search_skips_deleted(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+    ):
+        comment = await create_comment(
+            async_session, job, user, text="Привет, удаленный комментарий"
+        )
+        comment.is_deleted = True
+        await async_session.commit()
+
+        found = await crud_comments.search(
+            async_session, query="Привет", job_id=job.id
+        )
+        assert found == []
+
+    async def test_search_pagination(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+    ):
+        comments = [
+            await create_comment(
+                async_session, job, user, text=f"Привет, комментарий {i + 1}"
+            )
+            for i in range(3)
+        ]
+
+        first_page = await crud_comments.search(
+            async_session, query="Привет", job_id=job.id, skip=0, limit=2
+        )
+        second_page = await crud_comments.search(
+            async_session, query="Привет", job_id=job.id, skip=2, limit=2
+        )
+        assert len(first_page) == 2
+        assert len(second_page) == 1
+        found_ids = [comment.id for comment in first_page + second_page]
+        assert sorted(found_ids) == sorted(comment.id for comment in comments)
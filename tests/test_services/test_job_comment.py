@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.comments import comments as crud_comments
+from models.comment import JobComment
+from models.job import Job
+from models.user import User
+from services.job_comment import JobCommentService
+from tests.utils.comments import create_comment
+
+
+async def mark_deleted(
+    async_session: AsyncSession, comments: List[JobComment], days_ago: int
+) -> None:
+    deleted_at = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    if not JobComment.updated_at.type.timezone:
+        deleted_at = deleted_at.replace(tzinfo=None)
+    await async_session.execute(
+        update(JobComment)
+        .where(JobComment.id.in_([comment.id for comment in comments]))
+        .values(is_deleted=True, updated_at=deleted_at)
+    )
+    await async_session.commit()
+
+
+def walk(nodes: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for node in nodes:
+        yield node
+        yield from walk(node["children"])
+
+
+class TestJobCommentService:
+    async def test_get_comment_thread(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+    ):
+        """
+        Тест сборки дерева комментариев
+        - ответы вложены в родителя, их число ограничено children_limit;
+        - страницы корневых комментариев переключаются по next_cursor.
+        """
+        first_root = await create_comment(async_session, job, user)
+        replies = [
+            await create_comment(async_session, job, user, first_root)
+            for _ in range(3)
+        ]
+        nested_reply = await create_comment(
+            async_session, job, user, replies[0]
+        )
+        second_root = await create_comment(async_session, job, user)
+        third_root = await create_comment(async_session, job, user)
+
+        thread = await JobCommentService.get_comment_thread(
+            async_session, job, limit=2, children_limit=2
+        )
+        items = thread["items"]
+        assert [node["comment"].id for node in items] == [
+            first_root.id,
+            second_root.id,
+        ]
+        assert thread["next_cursor"] == second_root.id
+
+        children = items[0]["children"]
+        assert items[0]["children_count"] == 3
+        assert [node["comment"].id for node in children] == [
+            replies[0].id,
+            replies[1].id,
+        ]
+        assert [node["comment"].id for node in children[0]["children"]] == [
+            nested_reply.id
+        ]
+
+        thread = await JobCommentService.get_comment_thread(
+            async_session, job, cursor=thread["next_cursor"], limit=2
+        )
+        assert [node["comment"].id for node in thread["items"]] == [
+            third_root.id
+        ]
+        assert thread["next_cursor"] is None
+
+    async def test_get_comment_thread_with_deleted(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+    ):
+        """
+        Тест удаленных комментариев в дереве
+        - удаленный комментарий с ответами заменяется заглушкой без текста;
+        - удаленные комментарии без ответов в дерево не попадают.
+        """
+        root = await create_comment(async_session, job, user)
+        deleted_reply = await create_comment(
+            async_session, job, user, root, text="Удаленный текст"
+        )
+        nested_reply = await create_comment(
+            async_session, job, user, deleted_reply
+        )
+        deleted_leaf = await create_comment(
+            async_session, job, user, root, text="Удаленный текст"
+        )
+        deleted_root = await create_comment(
+            async_session, job, user, text="Удаленный текст"
+        )
+        await mark_deleted(
+            async_session,
+            [deleted_reply, deleted_leaf, deleted_root],
+            days_ago=0,
+        )
+
+        thread = await JobCommentService.get_comment_thread(
+            async_session, job
+        )
+        items = thread["items"]
+        assert [node["comment"].id for node in items] == [root.id]
+        assert items[0]["children_count"] == 1
+        placeholder = items[0]["children"][0]
+        assert placeholder["comment"] is None
+        assert placeholder["is_deleted"]
+        assert [
+            node["comment"].id for node in placeholder["children"]
+        ] == [nested_reply.id]
+        assert all(
+            node["comment"].text != "Удаленный текст"
+            for node in walk(items)
+            if node["comment"] is not None
+        )
+
+    @pytest.mark.parametrize(
+        "limit, children_limit",
+        [(0, 10), (20, -1)],
+    )
+    async def test_get_comment_thread_invalid_limits(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        limit: int,
+        children_limit: int,
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await JobCommentService.get_comment_thread(
+                async_session,
+                job,
+                limit=limit,
+                children_limit=children_limit,
+            )
+        assert exc_info.value.status_code == 400
+
+    async def test_purge_deleted_comments(
+        self,
+        async_session: AsyncSession,
+        job: Job,
+        user: User,
+        mocker: MockerFixture,
+    ):
+        """
+        Тест окончательного удаления комментариев
+        - старый удаленный ответ удаляется первой пачкой, его удаленный
+          родитель - второй;
+        - недавно удаленный и не удаленный комментарии остаются.
+        """
+        parent = await create_comment(async_session, job, user)
+        reply = await create_comment(async_session, job, user, parent)
+        recent_deleted = await create_comment(async_session, job, user)
+        alive = await create_comment(async_session, job, user)
+        await mark_deleted(async_session, [parent, reply], days_ago=31)
+        await mark_deleted(async_session, [recent_deleted], days_ago=1)
+        spy_remove = mocker.spy(crud_comments, "remove_deleted_leaves")
+
+        removed = await JobCommentService.purge_deleted_comments(
+            async_session, retention=timedelta(days=30), batch_size=1
+        )
+        assert removed == 2
+        assert spy_remove.call_count == 3
+
+        result = await async_session.execute(
+            select(JobComment.id).where(
+                JobComment.id.in_(
+                    [parent.id, reply.id, recent_deleted.id, alive.id]
+                )
+            )
+        )
+        assert set(result.scalars().all()) == {recent_deleted.id, alive.id}
+
+    async def test_purge_deleted_liked_comment(
+        self,
+        async_session: AsyncSession,
+        http_client: AsyncClient,
+        auth_headers: dict,
+        job: Job,
+        user: User,
+        mocker: MockerFixture,
+    ):
+        mocker.patch(
+            "notifications.ws_manager.WebSocketManager.send_to_user",
+            return_value=None,
+        )
+        comment = await create_comment(async_session, job, user)
+        response = await http_client.post(
+            f"/check-point/api/v1/comment/add_like/{comment.uid}/",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        await mark_deleted(async_session, [comment], days_ago=31)
+
+        removed = await JobCommentService.purge_deleted_comments(
+            async_session, retention=timedelta(days=30)
+        )
+        assert removed == 1
+        result = await async_session.execute(
+            select(JobComment.id).where(JobComment.id == comment.id)
+        )
+        assert result.scalar_one_or_none() is None
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.comments import comments as crud_comments
+from models.comment import JobComment
+from models.job import Job
+from models.user import User
+from schemas.comment import JobCommentCreateDB
+
+
+async def create_comment(
+    async_session: AsyncSession,
+    job: Job,
+    user: User,
+    parent: Optional[JobComment] = None,
+    text: str = "Test comment",
+) -> JobComment:
+    return await crud_comments.create(
+        db=async_session,
+        obj_in=JobCommentCreateDB(
+            text=text,
+            parent_id=parent.id if parent else None,
+            author_id=user.id,
+            job_id=job.id,
+        ),
+    )
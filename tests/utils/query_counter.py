@@ -0,0 +1,48 @@
+import difflib
+from typing import List
+
+
+class QueryCounter:
+    """
+    Сбор SQL-запросов, выполненных движком во время теста.
+    - statements (list[str]):
+        Тексты запросов в порядке выполнения.
+    """
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    def __call__(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    def assert_max(self, limit: int) -> None:
+        assert self.count <= limit, (
+            f"Превышен лимит запросов: {self.count} > {limit}\n"
+            + "\n".join(
+                f"{number}. {statement}"
+                for number, statement in enumerate(self.statements, 1)
+            )
+        )
+
+    def assert_not_more_than(self, expected: List[str]) -> None:
+        assert self.count <= len(expected), (
+            f"Количество запросов выросло: {self.count} > {len(expected)}\n"
+            + "\n".join(
+                difflib.unified_diff(
+                    expected,
+                    self.statements,
+                    fromfile="expected",
+                    tofile="actual",
+                    lineterm="",
+                )
+            )
+        )